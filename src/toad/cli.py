@@ -253,8 +253,15 @@ def acp(
         )
         server.serve()
     else:
+        from toad.widgets.terminal import uvloop_factory
+
         app = ToadApp(agent_data=agent_data, project_dir=project_dir)
-        app.run()
+        if (loop_factory := uvloop_factory()) is not None:
+            import asyncio
+
+            asyncio.run(app.run_async(), loop_factory=loop_factory)
+        else:
+            app.run()
         app.run_on_exit()
 
     print("")
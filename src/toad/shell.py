@@ -4,7 +4,6 @@ from __future__ import annotations
 from contextlib import suppress
 import os
 import asyncio
-import codecs
 import fcntl
 import platform
 import pty
@@ -16,7 +15,7 @@ from typing import TYPE_CHECKING
 from textual import log
 from textual.message import Message
 
-from toad.shell_read import shell_read
+from toad.shell_read import PtyReader, shell_read, utf8_split
 from toad.session import SessionEvent
 from toad.widgets.terminal import Terminal
 
@@ -25,12 +24,15 @@ if TYPE_CHECKING:
 
 IS_MACOS = platform.system() == "Darwin"
 
+_WINSZ = struct.Struct("HHHH")
+"""Pre-compiled winsize layout expected by TIOCSWINSZ."""
+
 
 def resize_pty(fd, cols, rows):
     """Resize the pseudo-terminal"""
     # Pack the dimensions into the format expected by TIOCSWINSZ
     try:
-        size = struct.pack("HHHH", rows, cols, 0, 0)
+        size = _WINSZ.pack(rows, cols, 0, 0)
         fcntl.ioctl(fd, termios.TIOCSWINSZ, size)
     except OSError:
         # Possibly file descriptor closed
@@ -147,12 +149,17 @@ class Shell:
 
     async def run(self) -> None:
         current_directory = self.working_directory
+        loop = asyncio.get_running_loop()
 
-        master, slave = pty.openpty()
-        self.master = master
+        def open_pty() -> tuple[int, int]:
+            # Blocking pty / fcntl syscalls; keep them off the event loop.
+            master, slave = pty.openpty()
+            flags = fcntl.fcntl(master, fcntl.F_GETFL)
+            fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            return master, slave
 
-        flags = fcntl.fcntl(master, fcntl.F_GETFL)
-        fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        master, slave = await loop.run_in_executor(None, open_pty)
+        self.master = master
 
         env = os.environ.copy()
         env["FORCE_COLOR"] = "1"
@@ -188,12 +195,10 @@ class Shell:
 
         os.close(slave)
         BUFFER_SIZE = 64 * 1024
-        reader = asyncio.StreamReader(BUFFER_SIZE)
-        protocol = asyncio.StreamReaderProtocol(reader)
+        reader = PtyReader(BUFFER_SIZE)
 
-        loop = asyncio.get_event_loop()
         transport, _ = await loop.connect_read_pipe(
-            lambda: protocol, os.fdopen(master, "rb", 0)
+            lambda: reader, os.fdopen(master, "rb", 0)
         )
 
         self._ready_event.set()
@@ -204,7 +209,7 @@ class Shell:
                 shell_start += "\n"
             await self.write(shell_start, hide_echo=False, hide_output=self.hide_start)
 
-        unicode_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        carry = b""
 
         while True:
             data = await shell_read(reader, BUFFER_SIZE)
@@ -222,7 +227,18 @@ class Shell:
 
                     self._hide_echo.discard(string_bytes)
 
-            if line := unicode_decoder.decode(data, final=not data):
+            if data:
+                if not carry and data.isascii():
+                    # Pure ASCII (the overwhelmingly common case); no
+                    # character can straddle the chunk boundary.
+                    complete = data
+                else:
+                    complete, carry = utf8_split(carry + data if carry else data)
+            else:
+                # EOF; flush any incomplete trailing sequence.
+                complete, carry = carry, b""
+
+            if line := complete.decode("utf-8", "replace"):
                 if self.terminal is None or self.terminal.is_finalized:
                     previous_state = (
                         None if self.terminal is None else self.terminal.state
@@ -3,8 +3,147 @@ from contextlib import suppress
 from time import monotonic
 
 
+def utf8_split(data: bytes) -> tuple[bytes, bytes]:
+    """Split bytes read from a stream on a UTF-8 character boundary.
+
+    PTY reads may end mid-character; rather than funnel every chunk through a
+    stateful incremental decoder, split off the (at most three byte)
+    incomplete trailing sequence and decode the rest in one C-level call,
+    carrying the tail over to the next read.
+
+    Args:
+        data: Bytes read from the stream.
+
+    Returns:
+        A tuple of (complete, carry) where `complete` ends on a character
+            boundary and `carry` is an incomplete trailing sequence (empty in
+            the common case).
+    """
+    scan = min(len(data), 3)
+    for back in range(1, scan + 1):
+        byte = data[-back]
+        if byte < 0b10000000:
+            # ASCII; the data ends on a boundary.
+            break
+        if byte >= 0b11000000:
+            # A lead byte; carry it if its sequence is incomplete.
+            if byte >= 0b11110000:
+                expected = 4
+            elif byte >= 0b11100000:
+                expected = 3
+            else:
+                expected = 2
+            if expected > back:
+                return data[:-back], data[-back:]
+            break
+        # A continuation byte; keep scanning back for the lead byte.
+    return data, b""
+
+
+class PtyReader(asyncio.BufferedProtocol):
+    """A minimal buffered-protocol reader for PTY pipes.
+
+    Lighter than `StreamReader` + `StreamReaderProtocol`: transports which
+    support the buffered protocol fill a caller-owned buffer directly (no
+    intermediate bytes object per chunk). Pipe transports on the default loop
+    only call `data_received`, which is also implemented. Reading is paused
+    when pending data exceeds the buffer size and resumed as `read` drains
+    it, so a fast producer back-pressures through the PTY rather than growing
+    the pending buffer without bound.
+    """
+
+    def __init__(self, buffer_size: int) -> None:
+        """
+        Args:
+            buffer_size: Size of the receive buffer handed to the transport,
+                and the pending-data threshold at which reading is paused.
+        """
+        self._limit = buffer_size
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._pending = bytearray()
+        self._eof = False
+        self._waiter: asyncio.Future[None] | None = None
+        self._transport: asyncio.ReadTransport | None = None
+        self._paused = False
+
+    def _wake(self) -> None:
+        if (waiter := self._waiter) is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _maybe_pause(self) -> None:
+        if (
+            not self._paused
+            and len(self._pending) > self._limit
+            and self._transport is not None
+        ):
+            self._paused = True
+            self._transport.pause_reading()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.ReadTransport)
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._view
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._pending += self._view[:nbytes]
+        self._maybe_pause()
+        self._wake()
+
+    def data_received(self, data: bytes) -> None:
+        # Fallback for transports without buffered-protocol support.
+        self._pending += data
+        self._maybe_pause()
+        self._wake()
+
+    def eof_received(self) -> bool | None:
+        self._eof = True
+        self._wake()
+        return False
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._eof = True
+        self._transport = None
+        self._wake()
+
+    async def read(self, size: int) -> bytes:
+        """Read up to `size` bytes (empty bytes on EOF).
+
+        Args:
+            size: Maximum number of bytes to return.
+
+        Returns:
+            Bytes read, which may be empty if the pipe closed.
+        """
+        while not self._pending and not self._eof:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        pending = self._pending
+        if not pending:
+            return b""
+        if len(pending) <= size:
+            data = bytes(pending)
+            pending.clear()
+        else:
+            data = bytes(pending[:size])
+            del pending[:size]
+        if (
+            self._paused
+            and len(pending) <= self._limit // 2
+            and self._transport is not None
+        ):
+            self._paused = False
+            self._transport.resume_reading()
+        return data
+
+
 async def shell_read(
-    reader: asyncio.StreamReader,
+    reader: asyncio.StreamReader | PtyReader,
     buffer_size: int,
     *,
     buffer_period: float | None = 1 / 100,
@@ -107,9 +107,13 @@ class Columns:
         if self._optimal_width_cache is not None:
             return self._optimal_width_cache
         gutter_width = (len(self.columns) - 1) * self.gutter
+        # Feed max() a list rather than a generator; it avoids per-step
+        # generator dispatch over what may be many rows.
         optimal_width = max(
-            sum(content.cell_length for content in row) + gutter_width
-            for row in self.rows
+            [
+                sum([content.cell_length for content in row]) + gutter_width
+                for row in self.rows
+            ]
         )
         self._optimal_width_cache = optimal_width
         return optimal_width
@@ -186,7 +190,7 @@ class Columns:
 
         for index, column in enumerate(self.columns):
             if column == "auto":
-                widths.append(max(row[index].cell_length for row in self.rows))
+                widths.append(max([row[index].cell_length for row in self.rows]))
             else:
                 widths.append(None)
 
@@ -1,5 +1,4 @@
 import asyncio
-import codecs
 from dataclasses import dataclass
 
 import os
@@ -12,11 +11,15 @@ import termios
 from textual import events
 from textual.message import Message
 
-from toad.shell_read import shell_read
+from toad.shell_read import PtyReader, shell_read, utf8_split
 
 from toad.widgets.terminal import Terminal
 
 
+_WINSZ = struct.Struct("HHHH")
+"""Pre-compiled winsize layout expected by TIOCSWINSZ."""
+
+
 class CommandError(Exception):
     """An error occurred running the command."""
 
@@ -65,7 +68,7 @@ class CommandPane(Terminal):
             return
         width, height = self.scrollable_content_region.size
         try:
-            size = struct.pack("HHHH", height, width, 0, 0)
+            size = _WINSZ.pack(height, width, 0, 0)
             fcntl.ioctl(self._master, termios.TIOCSWINSZ, size)
         except OSError:
             pass
@@ -94,11 +97,17 @@ class CommandPane(Terminal):
 
         await self.wait_for_refresh()
 
-        master, slave = pty.openpty()
-        self._master = master
+        loop = asyncio.get_running_loop()
 
-        flags = fcntl.fcntl(master, fcntl.F_GETFL)
-        fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        def open_pty() -> tuple[int, int]:
+            # Blocking pty / fcntl syscalls; keep them off the event loop.
+            master, slave = pty.openpty()
+            flags = fcntl.fcntl(master, fcntl.F_GETFL)
+            fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            return master, slave
+
+        master, slave = await loop.run_in_executor(None, open_pty)
+        self._master = master
 
         # # Get terminal attributes
         # attrs = termios.tcgetattr(slave)
@@ -133,25 +142,27 @@ class CommandPane(Terminal):
         self.set_write_to_stdin(self.write_stdin)
 
         BUFFER_SIZE = 64 * 1024
-        reader = asyncio.StreamReader(BUFFER_SIZE)
-        protocol = asyncio.StreamReaderProtocol(reader)
+        reader = PtyReader(BUFFER_SIZE)
 
-        loop = asyncio.get_event_loop()
         transport, _ = await loop.connect_read_pipe(
-            lambda: protocol, os.fdopen(master, "rb", 0)
+            lambda: reader, os.fdopen(master, "rb", 0)
         )
 
-        # Create write transport
-        writer_protocol = asyncio.BaseProtocol()
-        self.write_transport, _ = await loop.connect_write_pipe(
-            lambda: writer_protocol,
-            os.fdopen(os.dup(master), "wb", 0),
-        )
-        unicode_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        carry = b""
         try:
             while True:
                 data = await shell_read(reader, BUFFER_SIZE)
-                if line := unicode_decoder.decode(data, final=not data):
+                if data:
+                    if not carry and data.isascii():
+                        # Pure ASCII (the overwhelmingly common case); no
+                        # character can straddle the chunk boundary.
+                        complete = data
+                    else:
+                        complete, carry = utf8_split(carry + data if carry else data)
+                else:
+                    # EOF; flush any incomplete trailing sequence.
+                    complete, carry = carry, b""
+                if line := complete.decode("utf-8", "replace"):
                     try:
                         await self.write(line)
                     except Exception as error:
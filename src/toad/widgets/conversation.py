@@ -6,11 +6,12 @@ from contextlib import suppress
 from itertools import filterfalse
 from operator import attrgetter
 import platform
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Mapping
 from pathlib import Path
 from time import monotonic
+from types import MappingProxyType
 
-from typing import Callable, Any
+from typing import Awaitable, Callable, Any
 
 from textual import log, on, work
 from textual.app import ComposeResult
@@ -60,6 +61,7 @@ if TYPE_CHECKING:
     from toad.widgets.terminal import Terminal
     from toad.widgets.agent_response import AgentResponse
     from toad.widgets.agent_thought import AgentThought
+    from toad.widgets.sessions import Sessions
     from toad.widgets.terminal_tool import TerminalTool
 
 
@@ -108,16 +110,27 @@ Need help? Ask on {HELP_URL}
 
 STOP_REASON_REFUSAL = """\
 ## Agent refusal
- 
-$AGENT has refused to continue. 
+
+$AGENT has refused to continue.
 
 Need help? Ask on {HELP_URL}
 """
 
+TOAD_SLASH_COMMANDS = [
+    SlashCommand("/about-toad", "Show information about Toad"),
+    SlashCommand("/rename-session", "Rename the current session", hint="NEW TITLE"),
+]
+"""Slash commands handled by Toad itself, rather than the agent."""
+
+_RESETTING_STATUSES: frozenset[str | None] = frozenset({None, "completed"})
+"""Tool call statuses which should reset the current response / thought."""
+
 
 class Loading(Static):
     """Tiny widget to show loading indicator."""
 
+    __slots__ = ()
+
     DEFAULT_CLASSES = "block"
     DEFAULT_CSS = """
     Loading {
@@ -131,6 +144,8 @@ class Cursor(Static):
     is used to navigate the discussion history.
     """
 
+    __slots__ = ("blink_timer",)
+
     follow_widget: var[Widget | None] = var(None)
     blink = var(True, toggle_class="-blink")
 
@@ -171,6 +186,8 @@ class Cursor(Static):
 
 
 class Contents(containers.VerticalGroup, can_focus=False):
+    __slots__ = ()
+
     def process_layout(
         self, placements: list[WidgetPlacement]
     ) -> list[WidgetPlacement]:
@@ -188,12 +205,16 @@ class Contents(containers.VerticalGroup, can_focus=False):
 
 
 class ContentsGrid(containers.Grid):
+    __slots__ = ()
+
     def pre_layout(self, layout) -> None:
         assert isinstance(layout, GridLayout)
         layout.stretch_height = True
 
 
 class Window(containers.VerticalScroll):
+    __slots__ = ()
+
     BINDING_GROUP_TITLE = "View"
     BINDINGS = [Binding("end", "screen.focus_prompt", "Prompt")]
 
@@ -288,7 +309,7 @@ class Conversation(containers.Vertical):
     agent: var[AgentBase | None] = var(None, bindings=True)
     agent_info: var[Content] = var(Content())
     agent_ready: var[bool] = var(False)
-    modes: var[dict[str, Mode]] = var({}, bindings=True)
+    modes: var[Mapping[str, Mode]] = var(dict, bindings=True)
     current_mode: var[Mode | None] = var(None)
     turn: var[Literal["agent", "client"] | None] = var(None, bindings=True)
     status: var[str] = var("")
@@ -324,10 +345,17 @@ class Conversation(containers.Vertical):
         self._agent_data: AgentData | None = (
             self._agents_data[0] if self._agents_data else None
         )
+        self._identity_to_name: dict[str, str] = {
+            agent_data["identity"]: (
+                agent_data.get("short_name") or agent_data["name"]
+            )
+            for agent_data in self._agents_data
+        }
         self._agent_fail = False
         self._mouse_down_offset: Offset | None = None
 
         self._focusable_terminals: list[Terminal] = []
+        self._terminals_dirty = False
 
         self.project_data_path = paths.get_project_data(project_path)
         self.shell_history = History(self.project_data_path / "shell_history.jsonl")
@@ -343,6 +371,12 @@ class Conversation(containers.Vertical):
 
         self._directory_changed = False
         self._directory_watcher: DirectoryWatcher | None = None
+        self._last_raw_cwd: str | None = None
+        self._sessions_widget: Sessions | None = None
+        self._slash_handlers: dict[str, Callable[[str], Awaitable[bool]]] = {
+            "about-toad": self._cmd_about_toad,
+            "rename-session": self._cmd_rename_session,
+        }
 
     @property
     def agent_title(self) -> str | None:
@@ -369,13 +403,14 @@ class Conversation(containers.Vertical):
             self.app.bell()
             return
 
+        # Single insert (including the trailing space) to avoid a double
+        # text-area refresh.
         insert_text = (
-            f'@"{insert_path_text}"'
+            f'@"{insert_path_text}" '
             if " " in insert_path_text
-            else f"@{insert_path_text}"
+            else f"@{insert_path_text} "
         )
         self.prompt.prompt_text_area.insert(insert_text)
-        self.prompt.prompt_text_area.insert(" ")
 
     async def watch_shell_history_index(self, previous_index: int, index: int) -> None:
         if previous_index == 0:
@@ -432,6 +467,64 @@ class Conversation(containers.Vertical):
     def update_node_styles(self, animate: bool = True) -> None:
         self.prompt.update_node_styles(animate=animate)
 
+    @property
+    def shell(self) -> Shell:
+        """The active shell, created on first use (or after the previous shell exited)."""
+        if self._shell is None or self._shell.is_finished:
+            platform_key = "macos" if platform.system() == "Darwin" else "linux"
+            self._shell = Shell(
+                self,
+                self.working_directory,
+                shell=self.app.settings.get(f"shell.{platform_key}.run", str),
+                start=self.app.settings.get(f"shell.{platform_key}.start", str),
+            )
+            self._shell.start()
+        return self._shell
+
+    async def post[WidgetType: Widget](
+        self,
+        widget: WidgetType,
+        *,
+        anchor: bool = True,
+        loading: bool = False,
+    ) -> WidgetType:
+        """Post a new block widget to the conversation.
+
+        Args:
+            widget: Widget to mount at the end of the conversation.
+            anchor: Keep the new widget scrolled in to view.
+            loading: Mount the widget in the loading state.
+
+        Returns:
+            The widget that was mounted.
+        """
+        if loading:
+            widget.loading = True
+        await self.contents.mount(widget)
+        if anchor:
+            self.window.anchor()
+        return widget
+
+    async def new_terminal(self) -> Terminal:
+        """Create and mount a new terminal to display shell output.
+
+        Returns:
+            The new terminal instance.
+        """
+        self._terminal_count += 1
+        width = self.window.size.width - 5 - self.window.styles.scrollbar_size_vertical
+        terminal = Terminal(
+            id=f"shell-terminal-{self._terminal_count}",
+            minimum_terminal_width=width,
+        )
+        await self.post(terminal)
+        self.add_focusable_terminal(terminal)
+        return terminal
+
+    def focus_prompt(self) -> None:
+        """Move focus to the prompt."""
+        self.prompt.focus()
+
     @property
     def _terminal(self) -> Terminal | None:
         """Return the last focusable terminal, if there is one.
@@ -439,17 +532,21 @@ class Conversation(containers.Vertical):
         Returns:
             A focusable (non finalized) terminal.
         """
-        # Terminals should be removed in response to the Terminal.FInalized message
-        # This is a bit of a sanity check
-        self._focusable_terminals[:] = list(
-            filterfalse(attrgetter("is_finalized"), self._focusable_terminals)
-        )
-
+        # Finalized terminals are compacted away lazily; skip them here rather
+        # than rebuilding the list on every read.
         for terminal in reversed(self._focusable_terminals):
-            if terminal.display:
+            if not terminal.is_finalized and terminal.display:
                 return terminal
         return None
 
+    def _compact_terminals_if_dirty(self) -> None:
+        """Drop finalized terminals from the focusable list, at most once per tick."""
+        if self._terminals_dirty:
+            self._terminals_dirty = False
+            self._focusable_terminals[:] = filterfalse(
+                attrgetter("is_finalized"), self._focusable_terminals
+            )
+
     def add_focusable_terminal(self, terminal: Terminal) -> None:
         """Add a focusable terminal.
 
@@ -466,11 +563,10 @@ class Conversation(containers.Vertical):
 
     @on(Terminal.Finalized)
     def on_terminal_finalized(self, event: Terminal.Finalized) -> None:
-        """Terminal was finalized, so we can remove it from the list."""
-        try:
-            self._focusable_terminals.remove(event.terminal)
-        except ValueError:
-            pass
+        """Terminal was finalized, so schedule its removal from the list."""
+        if not self._terminals_dirty:
+            self._terminals_dirty = True
+            self.call_later(self._compact_terminals_if_dirty)
         self.prompt.project_directory_updated()
         if self._directory_changed:
             self._directory_changed = False
@@ -534,6 +630,56 @@ class Conversation(containers.Vertical):
 
         return True
 
+    def validate_cursor_offset(self, offset: int) -> int:
+        return clamp(offset, -1, len(self.contents.displayed_children) - 1)
+
+    def watch_cursor_offset(self) -> None:
+        cursor_block = self.cursor_block
+        self.cursor.follow(cursor_block)
+        if cursor_block is not None:
+            cursor_block.scroll_visible()
+        self.refresh_bindings()
+
+    def action_cursor_up(self) -> None:
+        if not self.contents.displayed_children:
+            raise SkipAction()
+        if self.cursor_offset == -1:
+            self.window.focus(scroll_visible=False)
+            self.cursor_offset = len(self.contents.displayed_children) - 1
+        else:
+            self.cursor_offset = max(0, self.cursor_offset - 1)
+
+    def action_cursor_down(self) -> None:
+        if self.cursor_offset == -1:
+            raise SkipAction()
+        if self.cursor_offset == len(self.contents.displayed_children) - 1:
+            self.cursor_offset = -1
+            self.focus_prompt()
+        else:
+            self.cursor_offset += 1
+
+    async def action_select_block(self) -> None:
+        cursor_block = self.cursor_block_child
+        if cursor_block is None or not isinstance(cursor_block, MenuProtocol):
+            raise SkipAction()
+        menu_items = list(cursor_block.get_block_menu())
+        if not menu_items:
+            raise SkipAction()
+        menu = Menu(cursor_block, menu_items)
+        await self.window.mount(menu)
+        menu.focus()
+
+    async def action_cancel(self) -> None:
+        if self.agent is not None and self.turn == "agent":
+            if await self.agent.cancel():
+                self.flash("Cancelling agent's turn", style="warning")
+        else:
+            raise SkipAction()
+
+    def action_mode_switcher(self) -> None:
+        if self.modes:
+            self.prompt.mode_switcher.focus()
+
     async def action_focus_terminal(self) -> None:
         if self._terminal is not None:
             self._terminal.focus()
@@ -700,6 +846,13 @@ class Conversation(containers.Vertical):
                     style="success",
                 )
 
+    @on(acp_messages.SetModes)
+    def on_set_modes(self, message: acp_messages.SetModes) -> None:
+        # Modes are static once delivered, so freeze the mapping.
+        modes = MappingProxyType(message.modes)
+        self.modes = modes
+        self.current_mode = modes.get(message.current_mode)
+
     @on(acp_messages.ModeUpdate)
     def on_mode_update(self, event: acp_messages.ModeUpdate) -> None:
         if (modes := self.modes) is not None:
@@ -716,7 +869,23 @@ class Conversation(containers.Vertical):
             # Record shell command in the current session.
             self.session_store.append_event(
                 SessionEvent(
-                    role="():
+                    role="shell",
+                    type="shell_command",
+                    text=event.body,
+                    agent_identity=None,
+                )
+            )
+            from toad.widgets.shell_result import ShellResult
+
+            await self.post(ShellResult(event.body))
+            self._shell_count += 1
+            width = (
+                self.window.size.width - 5 - self.window.styles.scrollbar_size_vertical
+            )
+            height = self.window.scrollable_content_region.height - 2
+            await self.shell.send(event.body, width, height)
+        else:
+            text = event.body
             await self.prompt_history.append(event.body)
             self.prompt_history_index = 0
             if text.startswith("/") and await self.slash_command(text):
@@ -772,8 +941,6 @@ class Conversation(containers.Vertical):
             await self._agent_thought.remove()
 
         self.turn = "client"
-        if self._agent_thought is not None and self._agent_thought.loading:
-            await self._agent_thought.remove()
         if self._loading is not None:
             await self._loading.remove()
         self._agent_response = None
@@ -838,23 +1005,33 @@ class Conversation(containers.Vertical):
         await event.menu.remove()
 
     @on(CurrentWorkingDirectoryChanged)
-    def on_current_working_directory_changed(
+    async def on_current_working_directory_changed(
         self, event: CurrentWorkingDirectoryChanged
     ) -> None:
-        self.working_directory = str(Path(event.path).resolve().absolute())
+        # Path.resolve hits the filesystem, so skip it if the raw path hasn't
+        # changed, and run it in a thread where it can't block the event loop.
+        path = event.path
+        if path == self._last_raw_cwd:
+            return
+        self._last_raw_cwd = path
+        self.working_directory = await asyncio.to_thread(
+            lambda: str(Path(path).resolve().absolute())
+        )
 
-    def watch_busy_count(self, busy: int) -> None:
-        self.throbber.set_class(busy > 0, "-busy")
+    def watch_busy_count(self, previous: int, busy: int) -> None:
+        # Only touch classes on a 0 <-> nonzero transition, to avoid
+        # invalidating styles on every WorkStarted / WorkFinished.
+        was_busy = previous > 0
+        is_busy = busy > 0
+        if was_busy != is_busy:
+            self.throbber.set_class(is_busy, "-busy")
 
     @on(acp_messages.UpdateStatusLine)
     async def on_update_status_line(self, message: acp_messages.UpdateStatusLine):
         self.status = message.status_line
 
     def _agent_name_for_identity(self, identity: str) -> str:
-        for agent_data in self._agents_data:
-            if agent_data["identity"] == identity:
-                return agent_data.get("short_name") or agent_data["name"]
-        return identity
+        return self._identity_to_name.get(identity, identity)
 
     @on(acp_messages.Update)
     async def on_acp_agent_message(self, message: acp_messages.Update):
@@ -885,6 +1062,24 @@ class Conversation(containers.Vertical):
             text = f"[{name}] {text}"
         await self.post_agent_thought(text)
 
+    def request_permissions(
+        self,
+        result_future: Future[Answer],
+        options: list[Answer],
+        tool_call: acp_protocol.ToolCallUpdatePermissionRequest,
+    ) -> None:
+        """Ask the user to answer a permission request from the agent.
+
+        Args:
+            result_future: Future to receive the user's answer.
+            options: Possible answers to present to the user.
+            tool_call: The tool call requesting permission.
+        """
+        from toad.widgets.question import Ask
+
+        question = tool_call.get("title") or "Allow this operation?"
+        self.prompt.ask(Ask(question, options, result_future.set_result))
+
     @on(acp_messages.RequestPermission)
     async def on_acp_request_permission(self, message: acp_messages.RequestPermission):
         message.stop()
@@ -916,7 +1111,7 @@ class Conversation(containers.Vertical):
         if self.contents.children and isinstance(
             (current_plan := self.contents.children[-1]), Plan
         ):
-            current_plan.entries = entries
+            current_plan.update_entries(entries)
         else:
             await self.post(Plan(entries))
 
@@ -929,7 +1124,7 @@ class Conversation(containers.Vertical):
 
         tool_call = message.tool_call
 
-        if tool_call.get("status", None) in (None, "completed"):
+        if tool_call.get("status") in _RESETTING_STATUSES:
             self._agent_thought = None
             self._agent_response = None
 
@@ -947,18 +1142,20 @@ class Conversation(containers.Vertical):
     async def on_acp_available_commands_update(
         self, message: acp_messages.AvailableCommandsUpdate
     ):
-        slash_commands: list[SlashCommand] = []
-        for available_command in message.commands:
-            input = available_command.get("input", {}) or {}
-            slash_command = SlashCommand(
+        self.agent_slash_commands = [
+            SlashCommand(
                 f"/{available_command['name']}",
                 available_command["description"],
-                hint=input.get("hint"),
+                hint=(available_command.get("input") or {}).get("hint"),
             )
-            slash_commands.append(slash_command)
-        self.agent_slash_commands = slash_commands
+            for available_command in message.commands
+        ]
         self.update_slash_commands()
 
+    def update_slash_commands(self) -> None:
+        """Update the prompt with Toad and agent slash commands."""
+        self.prompt.slash_commands = [*TOAD_SLASH_COMMANDS, *self.agent_slash_commands]
+
     def get_terminal(self, terminal_id: str) -> TerminalTool | None:
         """Get a terminal from its id.
 
@@ -968,13 +1165,8 @@ class Conversation(containers.Vertical):
         Returns:
             Terminal instance, or `None` if no terminal was found.
         """
-        from toad.widgets.terminal_tool import TerminalTool
-
-        try:
-            terminal = self.contents.query_one(f"#{terminal_id}", TerminalTool)
-        except NoMatches:
-            return None
-        if terminal.released:
+        terminal = self.terminals.get(terminal_id)
+        if terminal is None or terminal.released:
             return None
         return terminal
 
@@ -1014,12 +1206,14 @@ class Conversation(containers.Vertical):
             await terminal.start(width, height)
         except Exception as error:
             log(str(error))
+            self.terminals.pop(message.terminal_id, None)
             message.result_future.set_result(False)
             return
 
         try:
             await self.post(terminal)
         except Exception:
+            self.terminals.pop(message.terminal_id, None)
             message.result_future.set_result(False)
         else:
             # Treat ACP terminals as focusable so ctrl+f can jump to them.
@@ -1045,6 +1239,7 @@ class Conversation(containers.Vertical):
         if (terminal := self.get_terminal(message.terminal_id)) is not None:
             terminal.kill()
             terminal.release()
+            self.terminals.pop(message.terminal_id, None)
 
     @work
     @on(acp_messages.WaitForTerminalExit)
@@ -1092,9 +1287,10 @@ class Conversation(containers.Vertical):
         self._session_summary = None
         self._session_summary_used = False
 
-        # Clear current contents.
-        for child in list(self.contents.children):
-            await child.remove()
+        # Clear current contents in a single batched operation.
+        await self.contents.remove_children()
+        # The mounted terminals are gone; drop them from the index too.
+        self.terminals.clear()
         self.cursor_offset = -1
         self.cursor.display = False
 
@@ -1105,7 +1301,10 @@ class Conversation(containers.Vertical):
 
         # Rebuild a simple transcript: user prompts, agent messages, and shell activity.
         # Build a simple textual transcript and keep it for summarization.
+        # Widgets are collected and mounted in one batch, rather than paying a
+        # mount / layout per event.
         transcript_lines: list[str] = []
+        replay_widgets: list[Widget] = []
         for event_data in events:
             role = event_data.get("role")
             text = event_data.get("text") or ""
@@ -1113,18 +1312,20 @@ class Conversation(containers.Vertical):
             if not text:
                 continue
             if role == "user" and event_type == "message":
-                await self.post(UserInputWidget(text), anchor=False)
+                replay_widgets.append(UserInputWidget(text))
                 transcript_lines.append(f"User: {text}")
             elif role == "agent" and event_type == "message":
-                await self.post(AgentResponseWidget(text), anchor=False)
+                replay_widgets.append(AgentResponseWidget(text))
                 transcript_lines.append(f"Agent: {text}")
             elif role == "shell" and event_type == "shell_command":
-                await self.post(ShellResult(text), anchor=False)
+                replay_widgets.append(ShellResult(text))
                 transcript_lines.append(f"Shell command: {text}")
             elif role == "shell" and event_type == "shell_output":
                 # Render output as a simple Static block.
-                await self.post(Static(text, classes="shell-output"), anchor=False)
+                replay_widgets.append(Static(text, classes="shell-output"))
                 transcript_lines.append(f"Shell output: {text}")
+        if replay_widgets:
+            await self.contents.mount_all(replay_widgets)
 
         # If the transcript is long, generate a summary that will be injected
         # into the next prompt sent to the agent and persisted in the summary chain.
@@ -1174,38 +1375,53 @@ class Conversation(containers.Vertical):
                 be forwarded to the agent.
         """
         command, _, parameters = text[1:].partition(" ")
-        if command == "about-toad":
-            from toad import about
-            from toad.widgets.markdown_note import MarkdownNote
+        handler = self._slash_handlers.get(command)
+        if handler is None:
+            return False
+        return await handler(parameters)
+
+    async def _cmd_about_toad(self, parameters: str) -> bool:
+        """Handle the /about-toad slash command."""
+        from toad import about
+        from toad.widgets.markdown_note import MarkdownNote
 
-            app = self.app
-            about_md = about.render(app)
-            await self.post(MarkdownNote(about_md, classes="about"))
-            self.app.copy_to_clipboard(about_md)
-            self.notify(
-                "A copy of /about-toad has been placed in your clipboard",
-                title="About",
-            )
+        app = self.app
+        about_md = about.render(app)
+        await self.post(MarkdownNote(about_md, classes="about"))
+        self.app.copy_to_clipboard(about_md)
+        self.notify(
+            "A copy of /about-toad has been placed in your clipboard",
+            title="About",
+        )
+        return True
+
+    async def _cmd_rename_session(self, parameters: str) -> bool:
+        """Handle the /rename-session slash command."""
+        title = parameters.strip()
+        if not title:
+            self.flash("Usage: /rename-session &lt;new title&gt;", style="warning")
             return True
-        if command == "rename-session":
-            title = parameters.strip()
-            if not title:
-                self.flash("Usage: /rename-session &lt;new title&gt;", style="warning")
-                return True
-            session_id = self.session_store.current_session_id
-            if session_id is None:
-                # Fall back to latest session for this project.
-                sessions = self.session_store.list_sessions()
-                session_id = sessions[0]["session_id"] if sessions else None
-            if session_id is None:
-                self.flash("No session to rename.", style="warning")
-                return True
-            self.session_store.rename_session(session_id, title)
-            # Refresh sessions panel if present.
+        session_id = self.session_store.current_session_id
+        if session_id is None:
+            # Fall back to latest session for this project.
+            sessions = self.session_store.list_sessions()
+            session_id = sessions[0]["session_id"] if sessions else None
+        if session_id is None:
+            self.flash("No session to rename.", style="warning")
+            return True
+        self.session_store.rename_session(session_id, title)
+        # Refresh the sessions panel if present (cached to avoid a tree
+        # walk on every rename).
+        sessions_widget = self._sessions_widget
+        if sessions_widget is None or not sessions_widget.is_attached:
             from toad.widgets.sessions import Sessions
 
-            for sessions_widget in self.screen.query(Sessions):
-                await sessions_widget.reload()
-            self.flash(f"Session renamed to '{title}'", style="success")
-            return True
-        return False
+            try:
+                sessions_widget = self.screen.query_one(Sessions)
+            except NoMatches:
+                sessions_widget = None
+            self._sessions_widget = sessions_widget
+        if sessions_widget is not None:
+            await sessions_widget.reload()
+        self.flash(f"Session renamed to '{title}'", style="success")
+        return True
@@ -19,6 +19,9 @@ from pygments.token import Token
 RE_MATCH_FILE_PROMPT = re.compile(r"(@\S+)|@\"(.*)\"")
 RE_SLASH_COMMAND = re.compile(r"(\/\S*)(\W.*)?$")
 
+_assemble = Text.assemble
+"""Local binding; `get_line` runs once per visible line per frame."""
+
 
 class TextualHighlightTheme(HighlightTheme):
     """Contains the style definition for user with the highlight method."""
@@ -63,6 +66,12 @@ class TextualHighlightTheme(HighlightTheme):
 class HighlightedTextArea(TextArea):
     highlight_language = reactive("markdown")
 
+    MAX_LINE_CACHE = 4096
+    """Maximum number of highlighted lines to memoize."""
+
+    BACKGROUND_HIGHLIGHT_THRESHOLD = 10_000
+    """Buffers at least this large are highlighted in a worker thread."""
+
     @dataclass
     class CursorMove(Message):
         selection: Selection
@@ -77,8 +86,10 @@ class HighlightedTextArea(TextArea):
         disabled: bool = False,
         placeholder: str | Content = "",
     ):
-        self._text_cache: dict[int, Text] = {}
+        self._text_cache: dict[int, list[tuple[str, str]]] = {}
         self._highlight_lines: list[Content] | None = None
+        self._line_highlight_cache: dict[str, Content] = {}
+        self._visual_style_cached = None
         super().__init__(
             text,
             name=name,
@@ -93,6 +104,8 @@ class HighlightedTextArea(TextArea):
     def _clear_caches(self) -> None:
         self._highlight_lines = None
         self._text_cache.clear()
+        self._line_highlight_cache.clear()
+        self._visual_style_cached = None
 
     def notify_style_update(self) -> None:
         self._clear_caches()
@@ -115,6 +128,22 @@ class HighlightedTextArea(TextArea):
 
             language = self.highlight_language
             if language == "markdown":
+                if len(text) >= self.BACKGROUND_HIGHLIGHT_THRESHOLD:
+                    # Too large to highlight on the UI thread; render plain
+                    # text until the background worker installs highlights.
+                    self._highlight_lines = [
+                        Content(line) for line in text.split("\n")
+                    ]
+                    return self._highlight_lines
+                if "```" not in text:
+                    # Without fences, Markdown highlights line-by-line, so
+                    # unchanged lines can be served from the memo cache rather
+                    # than re-highlighting the entire buffer per keystroke.
+                    self._highlight_lines = [
+                        self._highlight_markdown_line(line)
+                        for line in text.split("\n")
+                    ]
+                    return self._highlight_lines
                 content = self.highlight_markdown(text)
                 content_lines = content.split("\n", allow_blank=True)[:-1]
                 self._highlight_lines = content_lines
@@ -129,6 +158,23 @@ class HighlightedTextArea(TextArea):
     def highlight_slash_command(self, text: str) -> Content:
         return Content.styled(text, "$text-success")
 
+    def _highlight_markdown_line(self, line: str) -> Content:
+        """Highlight a single line of Markdown, memoized on the raw line text.
+
+        Args:
+            line: A line of Markdown (no newline).
+
+        Returns:
+            Highlighted content for the line.
+        """
+        cache = self._line_highlight_cache
+        if (content := cache.get(line)) is None:
+            content = self.highlight_markdown(line).split("\n", allow_blank=True)[0]
+            if len(cache) >= self.MAX_LINE_CACHE:
+                cache.clear()
+            cache[line] = content
+        return content
+
     def highlight_markdown(self, text: str) -> Content:
         """Highlight markdown content.
 
@@ -162,19 +208,44 @@ class HighlightedTextArea(TextArea):
     def _on_changed(self) -> None:
         self._highlight_lines = None
         self._text_cache.clear()
+        if (
+            self.highlight_language == "markdown"
+            and len(self.text) >= self.BACKGROUND_HIGHLIGHT_THRESHOLD
+        ):
+            self.run_worker(
+                self._rehighlight, thread=True, exclusive=True, group="rehighlight"
+            )
+
+    def _rehighlight(self) -> None:
+        """Highlight the whole buffer in a worker thread."""
+        text = self.text
+        content = self.highlight_markdown(text)
+        content_lines = content.split("\n", allow_blank=True)[:-1]
+        self.app.call_from_thread(self._install_highlight, text, content_lines)
+
+    def _install_highlight(self, text: str, content_lines: list[Content]) -> None:
+        """Install highlights computed off-thread (discarding stale results)."""
+        if text != self.text:
+            # The buffer changed while highlighting; a newer worker will land.
+            return
+        self._highlight_lines = content_lines
+        self._text_cache.clear()
+        self.refresh()
 
     def get_line(self, line_index: int) -> Text:
-        if (cached_line := self._text_cache.get(line_index)) is not None:
-            return cached_line.copy()
-        try:
-            line = self.highlight_lines[line_index]
-        except IndexError:
-            return Text("", end="", no_wrap=True)
-        rendered_line = list(line.render_segments(self.visual_style))
-        text = Text.assemble(
-            *[(text, style) for text, style, _ in rendered_line],
-            end="",
-            no_wrap=True,
-        )
-        self._text_cache[line_index] = text.copy()
-        return text
+        # Cache the cheap segment list rather than a Text instance; the
+        # caller may mutate the returned Text, so assemble a fresh one per
+        # call instead of deep copying in and out of the cache.
+        if (cached_segments := self._text_cache.get(line_index)) is None:
+            try:
+                line = self.highlight_lines[line_index]
+            except IndexError:
+                return Text("", end="", no_wrap=True)
+            if (visual_style := self._visual_style_cached) is None:
+                visual_style = self._visual_style_cached = self.visual_style
+            cached_segments = [
+                (text, style)
+                for text, style, _ in line.render_segments(visual_style)
+            ]
+            self._text_cache[line_index] = cached_segments
+        return _assemble(*cached_segments, end="", no_wrap=True)
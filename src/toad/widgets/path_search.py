@@ -2,11 +2,12 @@ from __future__ import annotations
 
 
 import asyncio
-from functools import lru_cache
+from functools import lru_cache, partial
 from operator import itemgetter
 import os
 from pathlib import Path
 import re2 as re
+from time import monotonic
 from typing import Sequence
 
 
@@ -21,6 +22,7 @@ from textual.actions import SkipAction
 
 from textual.reactive import var, Initialize
 from textual.content import Content, Span
+from textual.timer import Timer
 from textual.strip import Strip
 from textual.widget import Widget
 from textual import widgets
@@ -35,6 +37,39 @@ from toad.path_filter import PathFilter
 from toad.widgets.project_directory_tree import ProjectDirectoryTree
 
 
+_SCAN_CACHE_TTL = 5.0
+"""Seconds before a cached scan goes stale.
+
+The root mtime only reflects its direct children, so changes deeper in the
+tree must age out via the TTL.
+"""
+
+_scan_cache: dict[Path, tuple[float, float, list[Path]]] = {}
+"""Directory scan results keyed on root path, as (scan time, root mtime, paths)."""
+
+_scan_lock = asyncio.Lock()
+"""Single-flight lock so concurrent opens share one scan."""
+
+
+_UNDERLINE_SPANS = [Span(offset, offset + 1, "underline") for offset in range(1024)]
+"""Shared single-character underline spans (Span is immutable here)."""
+
+
+def _charmask(text: str) -> int:
+    """Build a 64-bit bitmask of the (folded) characters in `text`.
+
+    Args:
+        text: Text to mask (should be lowercased for case-insensitive use).
+
+    Returns:
+        Bitmask of the characters present.
+    """
+    mask = 0
+    for character in text:
+        mask |= 1 << (ord(character) & 63)
+    return mask
+
+
 class PathFuzzySearch(FuzzySearch):
     @classmethod
     @lru_cache(maxsize=1024)
@@ -106,6 +141,15 @@ class FuzzyInput(Input):
 
 
 class PathSearch(containers.VerticalGroup):
+    SEARCH_DEBOUNCE = 0.04
+    """Seconds to wait after a keystroke before searching."""
+
+    MAX_RESULTS = 20
+    """Maximum number of fuzzy matches to display."""
+
+    MAX_UNFILTERED_RESULTS = 100
+    """Maximum number of options to display when there is no query."""
+
     CURSOR_BINDING_GROUP = Binding.Group(description="Move selection")
     BINDINGS = [
         Binding(
@@ -142,6 +186,11 @@ class PathSearch(containers.VerticalGroup):
     def __init__(self, root: Path) -> None:
         super().__init__()
         self.root = root
+        self._plain_paths: list[str] = []
+        self._path_charmasks: list[int] = []
+        self._last_query: str = ""
+        self._last_survivors: list[int] = []
+        self._search_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with widgets.ContentSwitcher(initial="path-search-fuzzy"):
@@ -177,41 +226,70 @@ class PathSearch(containers.VerticalGroup):
 
     async def search(self, search: str) -> None:
         if not search:
+            self._last_query = ""
+            self._last_survivors = []
             self.option_list.set_options(
                 [
                     Option(highlighted_path, highlighted_path.plain)
-                    for highlighted_path in self.highlighted_paths[:100]
+                    for highlighted_path in self.highlighted_paths[
+                        : self.MAX_UNFILTERED_RESULTS
+                    ]
                 ],
             )
             return
 
         fuzzy_search = self.fuzzy_search
         fuzzy_search.cache.grow(len(self.paths))
-        scores: list[tuple[float, Sequence[int], Content]] = [
-            (
-                *fuzzy_search.match(search, highlighted_path.plain),
-                highlighted_path,
-            )
-            for highlighted_path in self.highlighted_paths
-        ]
-
-        scores = sorted(
-            [score for score in scores if score[0]], key=itemgetter(0), reverse=True
-        )
-        scores = scores[:20]
+        # Iterate plain strings (cached in watch_paths) rather than
+        # materializing `Content.plain` for every candidate on each keystroke.
+        match = fuzzy_search.match
+        plain_paths = self._plain_paths
+        highlighted_paths = self.highlighted_paths
+        # If the query extends the previous one, any path which failed to
+        # match the prefix can't match now — only rescore prior survivors.
+        if self._last_query and search.startswith(self._last_query):
+            candidate_indices: Sequence[int] = self._last_survivors
+        else:
+            candidate_indices = range(len(plain_paths))
+        survivors: list[int] = []
+        scores: list[tuple[float, Sequence[int], Content]] = []
+        # Cheap rejection first: a path which lacks any of the query's
+        # characters (or is shorter than the query) can never fuzzy match.
+        query_mask = _charmask(search.lower())
+        charmasks = self._path_charmasks
+        search_length = len(search)
+        for index in candidate_indices:
+            plain_path = plain_paths[index]
+            if (
+                search_length > len(plain_path)
+                or charmasks[index] & query_mask != query_mask
+            ):
+                continue
+            score, offsets = match(search, plain_path)
+            if score:
+                survivors.append(index)
+                scores.append((score, offsets, highlighted_paths[index]))
+        self._last_query = search
+        self._last_survivors = survivors
+
+        scores.sort(key=itemgetter(0), reverse=True)
+        # Only build options for results which can actually be displayed.
+        scores = scores[: self.MAX_RESULTS]
 
         def highlight_offsets(path: Content, offsets: Sequence[int]) -> Content:
             return path.add_spans(
-                [Span(offset, offset + 1, "underline") for offset in offsets]
+                [
+                    _UNDERLINE_SPANS[offset]
+                    if offset < 1024
+                    else Span(offset, offset + 1, "underline")
+                    for offset in offsets
+                ]
             )
 
         self.option_list.set_options(
             [
-                Option(
-                    highlight_offsets(path, offsets) if index < 20 else path,
-                    id=path.plain,
-                )
-                for index, (score, offsets, path) in enumerate(scores)
+                Option(highlight_offsets(path, offsets), id=path.plain)
+                for score, offsets, path in scores
             ]
         )
         with self.option_list.prevent(OptionList.OptionHighlighted):
@@ -279,8 +357,14 @@ class PathSearch(containers.VerticalGroup):
             self.post_message(Dismiss(self))
 
     @on(Input.Changed)
-    async def on_input_changed(self, event: Input.Changed):
-        await self.search(event.value)
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # Debounce bursts of keystrokes; only the last value within the
+        # window kicks off a search.
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(
+            self.SEARCH_DEBOUNCE, partial(self.search, event.value)
+        )
 
     @on(OptionList.OptionHighlighted)
     async def on_option_list_changed(self, event: OptionList.OptionHighlighted):
@@ -329,11 +413,24 @@ class PathSearch(containers.VerticalGroup):
             self.tree_view.path_filter = path_filter
             self.tree_view.clear()
             await self.tree_view.reload()
-            paths = await directory.scan(
-                root, path_filter=path_filter, add_directories=True
-            )
-
-            paths = [path.absolute() for path in paths]
+            try:
+                root_mtime = root.stat().st_mtime
+            except OSError:
+                root_mtime = -1.0
+            async with _scan_lock:
+                cached = _scan_cache.get(root)
+                if (
+                    cached is not None
+                    and monotonic() - cached[0] < _SCAN_CACHE_TTL
+                    and cached[1] == root_mtime
+                ):
+                    paths = cached[2]
+                else:
+                    paths = await directory.scan(
+                        root, path_filter=path_filter, add_directories=True
+                    )
+                    paths = [path.absolute() for path in paths]
+                    _scan_cache[root] = (monotonic(), root_mtime, paths)
             self.root = root
             self.paths = paths
         finally:
@@ -366,12 +463,18 @@ class PathSearch(containers.VerticalGroup):
                 return str(path.relative_to(self.root))
 
         display_paths = sorted(map(path_display, paths), key=str.lower)
+        self._plain_paths = display_paths
+        self._path_charmasks = [_charmask(path.lower()) for path in display_paths]
+        self._last_query = ""
+        self._last_survivors = []
         self.highlighted_paths = [self.highlight_path(path) for path in display_paths]
         self.option_list.set_options(
             [
                 Option(highlighted_path, id=highlighted_path.plain)
-                for highlighted_path in self.highlighted_paths
-            ][:100]
+                for highlighted_path in self.highlighted_paths[
+                    : self.MAX_UNFILTERED_RESULTS
+                ]
+            ]
         )
         with self.option_list.prevent(OptionList.OptionHighlighted):
             self.option_list.highlighted = 0
@@ -52,7 +52,7 @@ class Plan(containers.Grid):
 
     """
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class Entry:
         """Information about an entry in the Plan."""
 
@@ -70,6 +70,20 @@ class Plan(containers.Grid):
         "low": pill("L", "$primary-muted", "$text-primary"),
     }
 
+    _CLASS_COMBOS = {
+        (priority, status): f"priority-{priority} status-{status}"
+        for priority in ("high", "medium", "low")
+        for status in ("completed", "pending", "in_progress")
+    }
+    """Precomputed class strings for every priority / status combination."""
+
+    @classmethod
+    def _entry_classes(cls, entry: Entry) -> str:
+        return cls._CLASS_COMBOS.get(
+            (entry.priority, entry.status),
+            f"priority-{entry.priority} status-{entry.status}",
+        )
+
     def __init__(
         self,
         entries: list[Entry],
@@ -94,12 +108,52 @@ class Plan(containers.Grid):
                 newly_completed.add(entry)
         self.newly_completed = newly_completed
 
+    def update_entries(self, new_entries: list[Entry]) -> None:
+        """Update entries in place, avoiding a full recompose where possible.
+
+        Only entries which have actually changed get their widgets updated; if
+        the shape of the plan has changed, fall back to reassigning `entries`.
+
+        Args:
+            new_entries: The new list of entries.
+        """
+        entries = self.entries
+        if (
+            not self.is_mounted
+            or not entries
+            or not new_entries
+            or len(entries) != len(new_entries)
+            # A recompose from a previous update may not have landed yet, so
+            # also require the mounted widgets to match the expected shape.
+            or len(self.children) != 2 * len(new_entries)
+        ):
+            self.entries = new_entries
+            return
+        children = self.children
+        for index, (old_entry, new_entry) in enumerate(zip(entries, new_entries)):
+            if old_entry == new_entry:
+                continue
+            status_widget = children[index * 2]
+            text_widget = children[index * 2 + 1]
+            assert isinstance(status_widget, NonSelectableStatic)
+            assert isinstance(text_widget, StrikeText)
+            classes = self._entry_classes(new_entry)
+            status_widget.set_classes(f"status {classes}")
+            status_widget.update(self.render_status(new_entry.status))
+            text_widget.set_classes(f"plan {classes}")
+            if old_entry.content != new_entry.content:
+                text_widget.content = new_entry.content
+                text_widget.refresh(layout=True)
+            if new_entry.status == "completed" and old_entry.status != "completed":
+                self.call_after_refresh(text_widget.strike)
+        self.set_reactive(Plan.entries, new_entries)
+
     def compose(self) -> ComposeResult:
         if not self.entries:
             yield Static("No plan yet", classes="-no-plan")
             return
         for entry in self.entries:
-            classes = f"priority-{entry.priority} status-{entry.status}"
+            classes = self._entry_classes(entry)
             yield NonSelectableStatic(
                 self.render_status(entry.status),
                 classes=f"status {classes}",
@@ -116,14 +170,15 @@ class Plan(containers.Grid):
             ):
                 self.call_after_refresh(strike_text.strike)
 
+    STATUS_CONTENT = {
+        "completed": Content.from_markup("✔ "),
+        "pending": Content.styled("⏲ "),
+        "in_progress": Content.from_markup("⮕"),
+    }
+    """Shared status indicators (Content is immutable, so safe to reuse)."""
+
     def render_status(self, status: str) -> Content:
-        if status == "completed":
-            return Content.from_markup("✔ ")
-        elif status == "pending":
-            return Content.styled("⏲ ")
-        elif status == "in_progress":
-            return Content.from_markup("⮕")
-        return Content()
+        return self.STATUS_CONTENT.get(status) or Content()
 
 
 if __name__ == "__main__":
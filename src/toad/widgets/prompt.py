@@ -184,10 +184,12 @@ class PromptTextArea(HighlightedTextArea):
         self.hide_suggestion_on_blur = False
 
     def on_key(self, event: events.Key) -> None:
+        character = event.character
         if (
             not self.shell_mode
+            and character is not None
+            and character in "!$"
             and self.cursor_location == (0, 0)
-            and event.character in {"!", "$"}
         ):
             self.post_message(self.RequestShellMode())
             event.prevent_default()
@@ -286,16 +288,15 @@ class PromptTextArea(HighlightedTextArea):
         if not self.shell_mode:
             return
 
-        import shlex
-
-        prompt = self.query_ancestor(Prompt)
-
         if not self.cursor_at_end_of_text:
             return
 
-        _cursor_row, cursor_column = prompt.prompt_text_area.selection.end
-        pre_complete = self.text[:cursor_column]
-        post_complete = self.text[cursor_column:]
+        prompt = self.query_ancestor(Prompt)
+
+        _cursor_row, cursor_column = self.selection.end
+        text = self.text
+        pre_complete = text[:cursor_column]
+        post_complete = text[cursor_column:]
         shlex_tokens = shlex.split(pre_complete)
         if not shlex_tokens:
             return
@@ -398,6 +399,19 @@ class Prompt(containers.VerticalGroup):
     PROMPT_AI = Content.styled("❯", "$text-secondary")
     PROMPT_MULTILINE = Content.styled("☰", "$text-secondary")
 
+    PLACEHOLDER_SHELL = Content.from_markup(
+        "Enter shell command\t[r]▌esc▐[/r] prompt mode"
+    ).expand_tabs(8)
+    PLACEHOLDER_PROMPT = Content.assemble(
+        "What would you like to do?\t".expandtabs(8),
+        ("▌!▐", "r"),
+        " shell ",
+        ("▌/▐", "r"),
+        " commands ",
+        ("▌@▐", "r"),
+        " files",
+    )
+
     prompt_container = getters.query_one("#prompt-container", Widget)
     prompt_text_area = getters.query_one(PromptTextArea)
     prompt_label = getters.query_one("#prompt", Label)
@@ -438,10 +452,27 @@ class Prompt(containers.VerticalGroup):
         self.ask_queue: list[Ask] = []
         self.complete_callback = complete_callback
         self.project_path = project_path
+        self._shell_commands_raw: str | None = None
+        self._shell_commands: frozenset[str] = frozenset()
+        self._likely_shell_text: str | None = None
+        self._likely_shell: bool = False
+        self._text_area: PromptTextArea | None = None
+        self._prompt_state: tuple[bool, bool] | None = None
+
+    @property
+    def _cached_text_area(self) -> PromptTextArea:
+        """The prompt text area, resolved once rather than per DOM query.
+
+        `prompt_text_area` walks the DOM on every access; hot paths that run
+        per keystroke should use this cached resolution instead.
+        """
+        if (text_area := self._text_area) is None:
+            text_area = self._text_area = self.prompt_text_area
+        return text_area
 
     @property
     def text(self) -> str:
-        return self.prompt_text_area.text
+        return self._cached_text_area.text
 
     @text.setter
     def text(self, text: str) -> None:
@@ -549,13 +580,17 @@ class Prompt(containers.VerticalGroup):
 
     def update_prompt(self):
         """Update the prompt according to the current mode."""
+        prompt_state = (self.shell_mode, self.multi_line)
+        if prompt_state == self._prompt_state:
+            # The prompt only depends on these two flags; nothing to redo.
+            return
+        self._prompt_state = prompt_state
+        prompt_text_area = self._cached_text_area
         if self.shell_mode:
             self.prompt_label.update(self.PROMPT_SHELL, layout=False)
             self.add_class("-shell-mode")
-            self.prompt_text_area.placeholder = Content.from_markup(
-                "Enter shell command\t[r]▌esc▐[/r] prompt mode"
-            ).expand_tabs(8)
-            self.prompt_text_area.highlight_language = "shell"
+            prompt_text_area.placeholder = self.PLACEHOLDER_SHELL
+            prompt_text_area.highlight_language = "shell"
         else:
             self.prompt_label.update(
                 self.PROMPT_MULTILINE if self.multi_line else self.PROMPT_AI,
@@ -563,32 +598,29 @@ class Prompt(containers.VerticalGroup):
             )
             self.remove_class("-shell-mode")
 
-            self.prompt_text_area.placeholder = Content.assemble(
-                "What would you like to do?\t".expandtabs(8),
-                ("▌!▐", "r"),
-                " shell ",
-                ("▌/▐", "r"),
-                " commands ",
-                ("▌@▐", "r"),
-                " files",
-            )
-            self.prompt_text_area.highlight_language = "markdown"
+            prompt_text_area.placeholder = self.PLACEHOLDER_PROMPT
+            prompt_text_area.highlight_language = "markdown"
 
     @property
     def likely_shell(self) -> bool:
-        text = self.prompt_text_area.text
+        text = self._cached_text_area.text
+        if text == self._likely_shell_text:
+            return self._likely_shell
+        self._likely_shell_text = text
+
         if "\n" in text or " " in text or not text.strip():
+            self._likely_shell = False
             return False
 
-        shell_commands = {
-            command.strip()
-            for command in self.app.settings.get(
-                "shell.allow_commands", expect_type=str
-            ).split()
-        }
-        if text.split(" ", 1)[0] in shell_commands:
-            return True
-        return False
+        # Parse the allowed commands only when the setting text changes.
+        allow_commands = self.app.settings.get("shell.allow_commands", expect_type=str)
+        if allow_commands != self._shell_commands_raw:
+            self._shell_commands_raw = allow_commands
+            self._shell_commands = frozenset(allow_commands.split())
+
+        # No spaces at this point, so the text is a single token.
+        self._likely_shell = text in self._shell_commands
+        return self._likely_shell
 
     @property
     def is_shell_mode(self) -> bool:
@@ -625,7 +657,7 @@ class Prompt(containers.VerticalGroup):
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
         text = event.text_area.text
 
-        self.multi_line = "\n" in text or "```" in text
+        self.multi_line = text.find("\n") != -1 or text.find("```") != -1
 
         if not self.multi_line and self.likely_shell:
             self.shell_mode = True
@@ -701,8 +733,10 @@ class Prompt(containers.VerticalGroup):
         self.set_timer(0.3, remove_question)
 
     def suggest(self, suggestion: str) -> None:
-        if suggestion.startswith(self.text) and self.text != suggestion:
-            self.prompt_text_area.suggestion = suggestion[len(self.text) :]
+        text = self.text
+        rest = suggestion.removeprefix(text)
+        if rest and (not text or rest != suggestion):
+            self._cached_text_area.suggestion = rest
 
     def compose(self) -> ComposeResult:
         yield PathSearch(self.project_path).data_bind(root=Prompt.project_path)
@@ -1,39 +1,54 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
 
 from textual.app import ComposeResult
 from textual.widgets import OptionList, Static
+from textual.widgets.option_list import Option
 from textual.binding import Binding
 
 from toad.messages import SessionSelected
 from toad.session import SessionStore, SessionRecord
 
 
+@lru_cache(maxsize=1024)
+def _format_minute(minute: int) -> str:
+    dt = datetime.fromtimestamp(minute * 60)
+    # An f-string avoids strftime's format parsing; cached per minute since
+    # many sessions share display timestamps across reloads.
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+    )
+
+
 def _format_timestamp(timestamp: float | None) -> str:
     if not timestamp:
         return ""
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return _format_minute(int(timestamp) // 60)
     except Exception:
         return ""
 
 
-def _format_duration(seconds: float | None) -> str:
-    if not seconds:
-        return ""
-    minutes = int(seconds // 60)
-    hours, minutes = divmod(minutes, 60)
+@lru_cache(maxsize=1024)
+def _format_minutes(total_minutes: int) -> str:
+    hours, minutes = divmod(total_minutes, 60)
     if hours:
         return f"{hours}h {minutes}m"
     return f"{minutes}m"
 
 
-@dataclass
+def _format_duration(seconds: float | None) -> str:
+    if not seconds:
+        return ""
+    return _format_minutes(int(seconds) // 60)
+
+
+@dataclass(slots=True)
 class SessionSummary:
     session_id: str
     title: str
@@ -55,6 +70,9 @@ class Sessions(Static):
         Binding("enter", "open", "Open session", show=False),
     ]
 
+    MAX_SESSIONS = 200
+    """Maximum number of (most recent) sessions to display."""
+
     def __init__(self, project_path: Path) -> None:
         super().__init__()
         self._project_path = project_path
@@ -72,6 +90,18 @@ class Sessions(Static):
         self._store = SessionStore(project_data_path)
         return self._store
 
+    def _load_records(self) -> list[SessionRecord]:
+        """Create the store if required and read the session records.
+
+        Runs in a thread so the disk access doesn't stall the first paint.
+        """
+        store = self._ensure_store()
+        if store is None:
+            return []
+        # The records are newest first; cap how many the sidebar renders so
+        # long histories don't grow the initial render linearly.
+        return store.list_sessions()[: self.MAX_SESSIONS]
+
     def compose(self) -> ComposeResult:
         yield OptionList()
 
@@ -80,21 +110,19 @@ class Sessions(Static):
 
     async def reload(self) -> None:
         """Reload the list of sessions from disk."""
-        store = self._ensure_store()
+        records = await asyncio.to_thread(self._load_records)
         option_list = self.query_one(OptionList)
         option_list.clear()
         self._summaries.clear()
-        if store is None:
-            return
-
-        records: Iterable[SessionRecord] = store.list_sessions()
+        options: list[Option] = []
         for record in records:
             session_id = record.get("session_id", "")
             if not session_id:
                 continue
-            title = record.get("title") or ", ".join(
-                record.get("agent_identities") or []
-            ) or "Session"
+            title = record.get("title")
+            if not title:
+                identities = record.get("agent_identities")
+                title = (", ".join(identities) if identities else "") or "Session"
             started_at = record.get("started_at")
             duration = record.get("duration")
             fail = bool(record.get("fail"))
@@ -107,21 +135,23 @@ class Sessions(Static):
             )
             self._summaries.append(summary)
 
-        for summary in self._summaries:
-            when = _format_timestamp(summary.started_at)
-            duration_text = _format_duration(summary.duration)
-            label_parts = [summary.title]
+            when = _format_timestamp(started_at)
+            duration_text = _format_duration(duration)
+            label_parts = [title]
             meta_parts: list[str] = []
             if when:
                 meta_parts.append(when)
             if duration_text:
                 meta_parts.append(duration_text)
-            if summary.fail:
+            if fail:
                 meta_parts.append("failed")
             if meta_parts:
                 label_parts.append(" · ".join(meta_parts))
-            label = "  ".join(label_parts)
-            option_list.add_option(label, id=summary.session_id)
+            options.append(Option("  ".join(label_parts), id=session_id))
+
+        # A single add_options invalidates the option list once, rather than
+        # once per session.
+        option_list.add_options(options)
 
     def action_open(self) -> None:
         option_list = self.query_one(OptionList)
@@ -1,4 +1,6 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import partial
 from operator import itemgetter
 from typing import Iterable, Self, Sequence
 
@@ -10,6 +12,7 @@ from textual.content import Content, Span
 from textual import getters
 from textual.message import Message
 from textual.reactive import var
+from textual.timer import Timer
 from textual import containers
 from textual import widgets
 from textual.widgets.option_list import Option
@@ -51,6 +54,9 @@ class SlashComplete(containers.VerticalGroup):
     }
     """
 
+    FILTER_DEBOUNCE = 0.03
+    """Time in seconds to wait for further keystrokes before filtering."""
+
     input = getters.query_one(widgets.Input)
     option_list = getters.query_one(widgets.OptionList)
 
@@ -66,6 +72,14 @@ class SlashComplete(containers.VerticalGroup):
         id: str | None = None,
         classes: str | None = None,
     ) -> None:
+        self._indexed_commands: (
+            list[tuple[str, SlashCommand, Content, Content]] | None
+        ) = None
+        self._sorted_keys: list[str] = []
+        self._all_columns: Columns | None = None
+        self._all_options: list[Option] | None = None
+        self._filter_timer: Timer | None = None
+        self._last_filter_prompt: str | None = None
         super().__init__(id=id, classes=classes)
         self.slash_commands = list(slash_commands) if slash_commands else []
         self.fuzzy_search = FuzzySearch(case_sensitive=False)
@@ -88,11 +102,59 @@ class SlashComplete(containers.VerticalGroup):
     @on(widgets.Input.Changed)
     def on_input_changed(self, event: widgets.Input.Changed) -> None:
         event.stop()
-        self.filter_slash_commands(event.value)
+        # Debounce so a burst of keystrokes filters once, at the end.
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            self.FILTER_DEBOUNCE, partial(self.filter_slash_commands, event.value)
+        )
 
     async def watch_slash_commands(self) -> None:
+        self._indexed_commands = None
+        self._all_columns = None
+        self._all_options = None
+        self._last_filter_prompt = None
         self.filter_slash_commands(self.input.value)
 
+    def _build_command_index(self) -> list[tuple[str, SlashCommand, Content, Content]]:
+        """Build the slash command index, sorted by casefolded command.
+
+        The index is deduplicated on the command string and rebuilt only when
+        `slash_commands` changes, so `filter_slash_commands` doesn't need to
+        sort or casefold the commands on every keystroke. The prepared command
+        and help `Content` are cached alongside each command; `Content` caches
+        its own cell length, so reusing instances also avoids re-measuring
+        widths on every keystroke.
+
+        Returns:
+            A sorted list of (casefolded command, slash command, command
+                content, help content) tuples.
+        """
+        deduplicated_slash_commands = {
+            slash_command.command: slash_command
+            for slash_command in self.slash_commands
+        }
+        self._indexed_commands = [
+            (
+                slash_command.command.casefold(),
+                slash_command,
+                Content.styled(slash_command.command, "$text-success"),
+                Content.styled(slash_command.help, "dim"),
+            )
+            for slash_command in deduplicated_slash_commands.values()
+        ]
+        self._indexed_commands.sort(key=itemgetter(0))
+        self._sorted_keys = [key for key, _, _, _ in self._indexed_commands]
+        return self._indexed_commands
+
+    def _reset_highlight(self) -> None:
+        """Move the highlight back to the first option."""
+        if self.display:
+            self.option_list.highlighted = 0
+        else:
+            with self.option_list.prevent(widgets.OptionList.OptionHighlighted):
+                self.option_list.highlighted = 0
+
     def filter_slash_commands(self, prompt: str) -> None:
         """Filter slash commands by the given prompt.
 
@@ -100,82 +162,100 @@ class SlashComplete(containers.VerticalGroup):
             prompt: Text prompt.
         """
         prompt = prompt.lstrip("/").casefold()
-        columns = self.columns = Columns("auto", "flex")
 
-        slash_commands = sorted(
-            self.slash_commands,
-            key=lambda slash_command: slash_command.command.casefold(),
-        )
-        deduplicated_slash_commands = {
-            slash_command.command: slash_command for slash_command in slash_commands
-        }
-        self.fuzzy_search.cache.grow(len(deduplicated_slash_commands))
-
-        if prompt:
-            slash_prompt = f"/{prompt}"
-            scores: list[tuple[float, Sequence[int], SlashCommand]] = [
-                (
-                    *self.fuzzy_search.match(prompt, slash_command.command[1:]),
-                    slash_command,
-                )
-                for slash_command in slash_commands
-            ]
+        if prompt == self._last_filter_prompt:
+            # The options are already correct for this prompt (cursor moves
+            # and re-focus land here); just reset the highlight.
+            self._reset_highlight()
+            return
+        self._last_filter_prompt = prompt
+
+        if (indexed_commands := self._indexed_commands) is None:
+            indexed_commands = self._build_command_index()
+        self.fuzzy_search.cache.grow(len(indexed_commands))
+
+        if not prompt:
+            # The unfiltered view is requested on every focus; its rows and
+            # options don't depend on the prompt, so build them once per
+            # command list and reuse them.
+            if (all_options := self._all_options) is None:
+                all_columns = Columns("auto", "flex")
+                all_options = [
+                    Option(
+                        all_columns.add_row(command, help_content),
+                        id=slash_command.command,
+                    )
+                    for _key, slash_command, command, help_content in indexed_commands
+                ]
+                self._all_columns = all_columns
+                self._all_options = all_options
+            self.columns = self._all_columns
+            self.option_list.set_options(all_options)
+            self._reset_highlight()
+            return
 
-            scores = sorted(
-                [
+        columns = self.columns = Columns("auto", "flex")
+
+        # The index is sorted by casefolded command, so commands with the
+        # prompt as a prefix occupy a contiguous range found with two binary
+        # searches (rather than a `startswith` per command).
+        slash_prompt = f"/{prompt}"
+        keys = self._sorted_keys
+        prefix_start = bisect_left(keys, slash_prompt)
+        prefix_end = bisect_right(keys, slash_prompt + "\uffff", prefix_start)
+
+        match = self.fuzzy_search.match
+        scores: list[
+            tuple[float, Sequence[int], tuple[str, SlashCommand, Content, Content]]
+        ] = []
+        for index, entry in enumerate(indexed_commands):
+            score, highlights = match(prompt, entry[1].command[1:])
+            if score:
+                scores.append(
                     (
-                        (
-                            score * 2
-                            if slash_command.command.casefold().startswith(slash_prompt)
-                            else score
-                        ),
+                        score * 2 if prefix_start <= index < prefix_end else score,
                         highlights,
-                        slash_command,
+                        entry,
                     )
-                    for score, highlights, slash_command in scores
-                    if score
-                ],
-                key=itemgetter(0),
-                reverse=True,
-            )
-        else:
-            scores = [(1.0, [], slash_command) for slash_command in slash_commands]
+                )
+        scores.sort(key=itemgetter(0), reverse=True)
 
         def make_row(
-            slash_command: SlashCommand, indices: Iterable[int]
+            entry: tuple[str, SlashCommand, Content, Content],
+            indices: Iterable[int],
         ) -> tuple[Content, ...]:
             """Make a row for the Columns display.
 
             Args:
-                slash_command: The slash command instance.
+                entry: An entry from the slash command index.
                 indices: Indices of matching characters.
 
             Returns:
                 A tuple of `Content` instances for use as a column row.
             """
-            command = Content.styled(slash_command.command, "$text-success")
-            command = command.add_spans(
-                [Span(index + 1, index + 2, "underline not dim") for index in indices]
-            )
-            return (command, Content.styled(slash_command.help, "dim"))
+            _key, _slash_command, command, help_content = entry
+            if indices:
+                command = command.add_spans(
+                    [
+                        Span(index + 1, index + 2, "underline not dim")
+                        for index in indices
+                    ]
+                )
+            return (command, help_content)
 
         rows = [
             (
                 columns.add_row(
-                    *make_row(slash_command, indices),
+                    *make_row(entry, indices),
                 ),
-                slash_command.command,
+                entry[1].command,
             )
-            for _, indices, slash_command in scores
+            for _, indices, entry in scores
         ]
         self.option_list.set_options(
             Option(row, id=command_name) for row, command_name in rows
         )
-        if self.display:
-            self.option_list.highlighted = 0
-        else:
-            with self.option_list.prevent(widgets.OptionList.OptionHighlighted):
-                self.option_list.highlighted = 0
+        self._reset_highlight()
 
     def action_cursor_down(self) -> None:
         self.option_list.action_cursor_down()
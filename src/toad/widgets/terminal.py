@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 
 from time import monotonic
@@ -25,6 +26,25 @@ from toad import ansi
 ESCAPE_TAP_DURATION = 400 / 1000
 
 
+def uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get an event loop factory for uvloop, if available.
+
+    uvloop's libuv-backed loop significantly raises pipe throughput, which
+    drives how fast PTY output can be drained. uvloop is an optional
+    dependency, so this returns `None` when not installed. The factory is
+    intended for `asyncio.run(..., loop_factory=...)` rather than the policy
+    system, which is deprecated and slated for removal in Python 3.16.
+
+    Returns:
+        uvloop's event loop factory, or `None` if uvloop is not installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 class Terminal(ScrollView, can_focus=True):
     CURSOR_STYLE = Style.parse("reverse")
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 from asyncio.subprocess import Process
-import codecs
 import fcntl
 import os
 import pty
@@ -16,10 +15,19 @@ from typing import Mapping
 from textual.content import Content
 from textual.reactive import var
 
-from toad.shell_read import shell_read
+from toad.shell_read import PtyReader, shell_read, utf8_split
 from toad.widgets.terminal import Terminal
 
 
+_NOT_CONTINUATION = bytes(
+    0 if (byte & 0b11000000) == 0b10000000 else 1 for byte in range(256)
+)
+"""Translation table mapping UTF-8 continuation bytes to 0, all others to 1."""
+
+_WINSZ = struct.Struct("HHHH")
+"""Pre-compiled winsize layout expected by TIOCSWINSZ."""
+
+
 @dataclass
 class Command:
     """A command and corresponding environment."""
@@ -33,9 +41,15 @@ class Command:
     cwd: str
     """Current working directory."""
 
+    def __post_init__(self) -> None:
+        self._str: str | None = None
+
     def __str__(self) -> str:
-        command_str = shlex.join([self.command, *self.args]).strip("'")
-        return command_str
+        # Commands are not mutated after construction, so the shlex join is
+        # computed once (the border title may be rendered many times).
+        if self._str is None:
+            self._str = shlex.join([self.command, *self.args]).strip("'")
+        return self._str
 
 
 @dataclass
@@ -80,10 +94,17 @@ class TerminalTool(Terminal):
         self._output_byte_limit = output_byte_limit
         self._command_task: asyncio.Task | None = None
         self._output: deque[bytes] = deque()
+        if output_byte_limit is not None:
+            # Bounded output is kept in a ring buffer: steady-state memory is
+            # exactly the limit, and reading it back is at most two copies.
+            self._ring: bytearray | None = bytearray(output_byte_limit)
+        else:
+            self._ring = None
+        self._ring_pos = 0
+        self._ring_full = False
 
         self._process: Process | None = None
         self._bytes_read = 0
-        self._output_bytes_count = 0
         self._shell_fd: int | None = None
         self._return_code: int | None = None
         self._released: bool = False
@@ -119,7 +140,7 @@ class TerminalTool(Terminal):
             rows: Rows (height).
         """
         # Pack the dimensions into the format expected by TIOCSWINSZ
-        size = struct.pack("HHHH", rows, columns, 0, 0)
+        size = _WINSZ.pack(rows, columns, 0, 0)
         fcntl.ioctl(fd, termios.TIOCSWINSZ, size)
 
     async def wait_for_exit(self) -> tuple[int | None, str | None]:
@@ -151,8 +172,15 @@ class TerminalTool(Terminal):
         """Release the terminal (may no longer be used from ACP)."""
         self._released = True
 
-    def watch__command(self, command: Command) -> None:
-        self.border_title = str(command)
+    def watch__command(self, command: Command | None) -> None:
+        # Stringifying the command before the widget can render is wasted
+        # work; on_mount picks up the pending value.
+        if command is not None and self.is_mounted:
+            self.border_title = str(command)
+
+    def on_mount(self) -> None:
+        if self._command is not None:
+            self.border_title = str(self._command)
 
     async def start(self, width: int = 0, height: int = 0) -> None:
         assert self._command is not None
@@ -173,15 +201,34 @@ class TerminalTool(Terminal):
         finally:
             self._exit_event.set()
 
+    def _reset_output(self) -> None:
+        """Reset output bookkeeping for a (re)run.
+
+        The ring buffer allocated in `__init__` is reused; only positions and
+        counters are cleared, so restarting a command doesn't reallocate the
+        output-limit-sized buffer.
+        """
+        self._bytes_read = 0
+        self._output.clear()
+        self._ring_pos = 0
+        self._ring_full = False
+
     async def _run(self) -> None:
         self._command_task = asyncio.current_task()
+        self._reset_output()
 
         assert self._command is not None
-        master, slave = pty.openpty()
-        self._shell_fd = master
+        loop = asyncio.get_running_loop()
 
-        flags = fcntl.fcntl(master, fcntl.F_GETFL)
-        fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        def open_pty() -> tuple[int, int]:
+            # Blocking pty / fcntl syscalls; keep them off the event loop.
+            master, slave = pty.openpty()
+            flags = fcntl.fcntl(master, fcntl.F_GETFL)
+            fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            return master, slave
+
+        master, slave = await loop.run_in_executor(None, open_pty)
+        self._shell_fd = master
 
         command = self._command
         environment = os.environ | command.env
@@ -194,50 +241,68 @@ class TerminalTool(Terminal):
         shell = os.environ.get("SHELL", "sh")
         run_command = shlex.join([shell, "-c", run_command])
 
-        try:
-            process = self._process = await asyncio.create_subprocess_shell(
+        BUFFER_SIZE = 64 * 1024 * 2
+        reader = PtyReader(BUFFER_SIZE)
+
+        # Spawning the process and wiring the read transport touch
+        # independent ends of the PTY; overlap them.
+        process_result, pipe_result = await asyncio.gather(
+            asyncio.create_subprocess_shell(
                 run_command,
                 stdin=slave,
                 stdout=slave,
                 stderr=slave,
                 env=environment,
                 cwd=command.cwd,
-            )
-        except Exception as error:
+            ),
+            loop.connect_read_pipe(lambda: reader, os.fdopen(master, "rb", 0)),
+            return_exceptions=True,
+        )
+        if isinstance(process_result, BaseException) or isinstance(
+            pipe_result, BaseException
+        ):
+            # One half failed; close whichever half survived before raising.
+            if not isinstance(pipe_result, BaseException):
+                pipe_result[0].close()
+            if not isinstance(process_result, BaseException):
+                process_result.kill()
+                error = pipe_result
+            else:
+                error = process_result
             self._ready_event.set()
             print(error)
-            raise
+            raise error
+
+        process = self._process = process_result
+        transport, _ = pipe_result
 
         self._ready_event.set()
 
-        self.resize_pty(
+        await loop.run_in_executor(
+            None,
+            self.resize_pty,
             master,
             self._width or 80,
             self._height or 24,
         )
 
         os.close(slave)
-        BUFFER_SIZE = 64 * 1024 * 2
-        reader = asyncio.StreamReader(BUFFER_SIZE)
-        protocol = asyncio.StreamReaderProtocol(reader)
 
-        loop = asyncio.get_event_loop()
-        transport, _ = await loop.connect_read_pipe(
-            lambda: protocol, os.fdopen(master, "rb", 0)
-        )
-        # Create write transport
-        writer_protocol = asyncio.BaseProtocol()
-        write_transport, _ = await loop.connect_write_pipe(
-            lambda: writer_protocol,
-            os.fdopen(os.dup(master), "wb", 0),
-        )
-        self.writer = write_transport
-
-        unicode_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        carry = b""
         try:
             while True:
                 data = await shell_read(reader, BUFFER_SIZE)
-                if process_data := unicode_decoder.decode(data, final=not data):
+                if data:
+                    if not carry and data.isascii():
+                        # Pure ASCII (the overwhelmingly common case); no
+                        # character can straddle the chunk boundary.
+                        complete = data
+                    else:
+                        complete, carry = utf8_split(carry + data if carry else data)
+                else:
+                    # EOF; flush any incomplete trailing sequence.
+                    complete, carry = carry, b""
+                if process_data := complete.decode("utf-8", "replace"):
                     self._record_output(data)
                     if await self.write(process_data):
                         self.display = True
@@ -263,21 +328,33 @@ class TerminalTool(Terminal):
         Store at most the limit set in self._output_byte_limit (if set).
 
         """
-
-        self._output.append(data)
-        self._output_bytes_count += len(data)
         self._bytes_read += len(data)
 
-        if self._output_byte_limit is None:
+        if (ring := self._ring) is None:
+            self._output.append(data)
             return
 
-        while self._output_bytes_count > self._output_byte_limit and self._output:
-            oldest_bytes = self._output[0]
-            oldest_bytes_count = len(oldest_bytes)
-            if self._output_bytes_count - oldest_bytes_count < self._output_byte_limit:
-                break
-            self._output.popleft()
-            self._output_bytes_count -= oldest_bytes_count
+        limit = self._output_byte_limit
+        assert limit is not None
+        if len(data) >= limit:
+            ring[:] = data[-limit:]
+            self._ring_pos = 0
+            self._ring_full = True
+            return
+
+        position = self._ring_pos
+        end = position + len(data)
+        if end <= limit:
+            ring[position:end] = data
+            self._ring_pos = end % limit
+            self._ring_full = self._ring_full or end == limit
+        else:
+            # The write wraps; copy in two slices.
+            head_count = limit - position
+            ring[position:] = data[:head_count]
+            ring[: end - limit] = data[head_count:]
+            self._ring_pos = end - limit
+            self._ring_full = True
 
     def get_output(self) -> tuple[str, bool]:
         """Get the output.
@@ -285,33 +362,25 @@ class TerminalTool(Terminal):
         Returns:
             A tuple of the output and a bool to indicate if the output was truncated.
         """
-        output_bytes = b"".join(self._output)
-
-        def is_continuation(byte_value: int) -> bool:
-            """Check if the given byte is a utf-8 continuation byte.
-
-            Args:
-                byte_value: Ordinal of the byte.
-
-            Returns:
-                `True` if the byte is a continuation, or `False` if it is the start of a character.
-            """
-            return (byte_value & 0b11000000) == 0b10000000
-
-        truncated = False
-        if (
-            self._output_byte_limit is not None
-            and len(output_bytes) > self._output_byte_limit
-        ):
-            truncated = True
-            output_bytes = output_bytes[-self._output_byte_limit :]
-            # Must start on a utf-8 boundary
-            # Discard initial bytes that aren't a utf-8 continuation byte.
-            for offset, byte_value in enumerate(output_bytes):
-                if not is_continuation(byte_value):
-                    if offset:
-                        output_bytes = output_bytes[offset:]
-                    break
+        if (ring := self._ring) is None:
+            output_bytes = b"".join(self._output)
+            truncated = False
+        else:
+            # Linearize the ring: at most two copies.
+            position = self._ring_pos
+            if self._ring_full:
+                output_bytes = bytes(ring[position:]) + bytes(ring[:position])
+            else:
+                output_bytes = bytes(ring[:position])
+            truncated = self._bytes_read > len(output_bytes)
+
+        if truncated:
+            # Must start on a utf-8 boundary; discard leading continuation
+            # bytes. A character has at most three, so translate the first
+            # four bytes and find the first non-continuation in one C call.
+            offset = output_bytes[:4].translate(_NOT_CONTINUATION).find(1)
+            if offset > 0:
+                output_bytes = output_bytes[offset:]
 
         output = output_bytes.decode("utf-8", "replace")
         return output, truncated
@@ -1,5 +1,5 @@
 import re  # re2 doesn't have MULTILINE
-from typing import Iterable
+from typing import Callable, Iterable
 from rich.text import Text
 
 from textual import on
@@ -18,6 +18,9 @@ from toad.acp import protocol
 from toad.menus import MenuItem
 from toad.pill import pill
 
+_MARKDOWN_HEURISTIC = re.compile(r"```|^#{1,6}\s", re.MULTILINE)
+"""Matches a code fence or heading; a hint that text is Markdown."""
+
 
 class TextContent(Static):
     DEFAULT_CSS = """
@@ -73,6 +76,13 @@ class ToolCall(containers.VerticalGroup):
         classes: str | None = None,
     ) -> None:
         self._tool_call = tool_call
+        self._header_cache: tuple[tuple[bool, bool, str, str], Content] | None = None
+        self._content_handlers: dict[
+            str, Callable[[protocol.ToolCallContent], ComposeResult]
+        ] = {
+            "content": self._compose_content_item,
+            "diff": self._compose_diff_item,
+        }
         super().__init__(id=id, classes=classes)
 
     @property
@@ -82,6 +92,7 @@ class ToolCall(containers.VerticalGroup):
     @tool_call.setter
     def tool_call(self, tool_call: protocol.ToolCall):
         self._tool_call = tool_call
+        self._header_cache = None
         self.refresh(recompose=True)
 
     def get_block_menu(self) -> Iterable[MenuItem]:
@@ -153,6 +164,12 @@ class ToolCall(containers.VerticalGroup):
         title = tool_call.get("title", "title")
         status = tool_call.get("status", "pending")
 
+        # The header is rebuilt on every status tick and recompose; cache the
+        # assembled Content on everything it depends on.
+        cache_key = (self.has_content, self.expanded, title, status)
+        if self._header_cache is not None and self._header_cache[0] == cache_key:
+            return self._header_cache[1]
+
         expand_icon: Content = Content()
         if self.has_content:
             expand_icon = Content("▼ " if self.expanded else "▶ ")
@@ -169,6 +186,7 @@ class ToolCall(containers.VerticalGroup):
             header += Content.assemble(" ", pill("failed", "$error-muted", "$error"))
         elif status == "completed":
             header += Content.from_markup(" [$success]✔")
+        self._header_cache = (cache_key, header)
         return header
 
     def watch_expanded(self) -> None:
@@ -199,54 +217,58 @@ class ToolCall(containers.VerticalGroup):
         else:
             self.app.bell()
 
+    def _compose_content_block(
+        self, content_block: protocol.ContentBlock
+    ) -> ComposeResult:
+        # TODO: This may need updating
+        # Docs claim this should be "plain" text
+        # However, I have seen simple text, text with ansi escape sequences, and Markdown returned
+        # I think this is a flaw in the spec.
+        # For now I will attempt a heuristic to guess what the content actually contains
+        # https://agentclientprotocol.com/protocol/schema#param-text
+        if content_block.get("type") == "text":
+            text = content_block.get("text")
+            if text is None:
+                return
+            if text.find("\x1b") != -1:
+                parsed_ansi_text = Text.from_ansi(text)
+                yield TextContent(Content.from_rich_text(parsed_ansi_text))
+            elif _MARKDOWN_HEURISTIC.search(text):
+                yield MarkdownContent(text)
+            else:
+                yield TextContent(text, markup=False)
+
+    def _compose_content_item(
+        self, content: protocol.ToolCallContent
+    ) -> ComposeResult:
+        if (content_block := content.get("content")) is not None:
+            yield from self._compose_content_block(content_block)
+            self.has_content = True
+
+    def _compose_diff_item(self, content: protocol.ToolCallContent) -> ComposeResult:
+        path = content.get("path")
+        new_text = content.get("newText")
+        if path is None or new_text is None:
+            return
+        from toad.widgets.diff_view import DiffView
+
+        yield (diff_view := DiffView(path, path, content.get("oldText") or "", new_text))
+
+        if isinstance(self.app, ToadApp):
+            diff_view_setting = self.app.settings.get("diff.view", str)
+            diff_view.split = diff_view_setting == "split"
+            diff_view.auto_split = diff_view_setting == "auto"
+
+        self.has_content = True
+
     def _compose_content(
         self, tool_call_content: list[protocol.ToolCallContent]
     ) -> ComposeResult:
-        def compose_content_block(
-            content_block: protocol.ContentBlock,
-        ) -> ComposeResult:
-            match content_block:
-                # TODO: This may need updating
-                # Docs claim this should be "plain" text
-                # However, I have seen simple text, text with ansi escape sequences, and Markdown returned
-                # I think this is a flaw in the spec.
-                # For now I will attempt a heuristic to guess what the content actually contains
-                # https://agentclientprotocol.com/protocol/schema#param-text
-                case {"type": "text", "text": text}:
-                    if "\x1b" in text:
-                        parsed_ansi_text = Text.from_ansi(text)
-                        yield TextContent(Content.from_rich_text(parsed_ansi_text))
-                    elif "```" in text or re.search(
-                        r"^#{1,6}\s.*$", text, re.MULTILINE
-                    ):
-                        yield MarkdownContent(text)
-                    else:
-                        yield TextContent(text, markup=False)
-
+        handlers = self._content_handlers
         for content in tool_call_content:
-            match content:
-                case {"type": "content", "content": sub_content}:
-                    yield from compose_content_block(sub_content)
-                    self.has_content = True
-                case {
-                    "type": "diff",
-                    "path": path,
-                    "oldText": old_text,
-                    "newText": new_text,
-                }:
-                    from toad.widgets.diff_view import DiffView
-
-                    yield (diff_view := DiffView(path, path, old_text or "", new_text))
-
-                    if isinstance(self.app, ToadApp):
-                        diff_view_setting = self.app.settings.get("diff.view", str)
-                        diff_view.split = diff_view_setting == "split"
-                        diff_view.auto_split = diff_view_setting == "auto"
-
-                    self.has_content = True
-
-                case {"type": "terminal", "terminalId": terminal_id}:
-                    pass
+            # "terminal" (and unknown) content types render nothing.
+            if (handler := handlers.get(content.get("type"))) is not None:
+                yield from handler(content)
 
 
 if __name__ == "__main__":